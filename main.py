@@ -10,14 +10,9 @@ import os
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.app.mytempo_app import MyTempoApp
+from src.main import main
 
 __version__ = '0.5.3'  # No console window, improved Windows compatibility
 
-def main():
-    """Main function to start the application."""
-    app = MyTempoApp()
-    app.run()
-
 if __name__ == '__main__':
     main() 
\ No newline at end of file
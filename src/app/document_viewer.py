@@ -3,19 +3,24 @@ Document viewer for MyTempo application.
 """
 
 import os
+import queue
+import threading
 import tkinter as tk
-import tkinter.font as tkFont
 from tkinter import messagebox, ttk
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
 from src.core.config import UserConfig
 from src.core.scroll_manager import ScrollManager
 from src.core.text_processor import TextProcessor
 from src.ui.loading_window import LoadingWindow
-from src.utils.constants import (COLORS, DEFAULT_FONT_SIZE,
+from src.utils.constants import (CHINESE_FONT, COLORS, DEFAULT_FONT_SIZE,
                                  DEFAULT_OPACITY_INDEX, DEFAULT_WINDOW_HEIGHT,
-                                 DEFAULT_WINDOW_WIDTH, FONT_SIZES,
-                                 OPACITY_LEVELS, PADDING)
+                                 DEFAULT_WINDOW_WIDTH, DOCUMENT_POLL_INTERVAL,
+                                 FONT_SIZES, OPACITY_LEVELS, PADDING,
+                                 RENDER_BATCH_SIZE, RESIZE_DEBOUNCE_DELAY)
+from src.utils.encoding import decode_text
+from src.utils.font_loader import ensure_font_loaded
+from src.utils.window_geometry import center_on_screen
 
 # Version number
 VERSION = "0.5.3"  # Fixed circular import issues and improved module structure
@@ -33,8 +38,20 @@ class DocumentViewer:
         self.parent = parent
         self.file_path = file_path
         
+        # Pending resize update, resize events are coalesced
+        self._resize_after_id: Optional[str] = None
+        
+        # Retries left for sizing horizontal lines before the window is laid out
+        self._horizontal_line_retries = 2
+        
+        # Length of the horizontal lines currently in the document
+        self._horizontal_line_length: Optional[int] = None
+        
+        # Alpha currently applied to the window
+        self._current_alpha: Optional[float] = None
+        
         # Initialize user configuration
-        self.config = UserConfig()
+        self.config = UserConfig(root=parent)
         
         # Load user settings from config file
         self.current_font_size = self.config.get("font_size", DEFAULT_FONT_SIZE)
@@ -65,21 +82,13 @@ class DocumentViewer:
         window_width = self.config.get("window_width", DEFAULT_WINDOW_WIDTH)
         window_height = self.config.get("window_height", DEFAULT_WINDOW_HEIGHT)
         
-        # Get screen dimensions
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
-        
-        # Calculate window position to center it
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        
         # Set window size and position
-        self.window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        center_on_screen(self.window, window_width, window_height)
         
         # Set window properties
         self.window.configure(bg=COLORS['background'])
         self.window.attributes('-topmost', True)
-        self.window.attributes('-alpha', OPACITY_LEVELS[self.current_opacity_index])
+        self.apply_opacity()
         self.window.protocol("WM_DELETE_WINDOW", self.close_window)
         
         # Use after method to delay loading document
@@ -97,54 +106,99 @@ class DocumentViewer:
             # Update loading status
             self.loading_window.update_progress(2, 4, "Loading content...")
             
-            # Load file content
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            # Read and parse on a worker thread so the loading window stays responsive
+            self._parse_queue: queue.Queue = queue.Queue(maxsize=1)
+            threading.Thread(target=self.parse_document, daemon=True).start()
+            self.window.after(DOCUMENT_POLL_INTERVAL, self.poll_parsed_document)
             
-            # Update loading status
-            self.loading_window.update_progress(3, 4, "Rendering content...")
+        except Exception as e:
+            self.show_load_error(e)
+
+    def parse_document(self) -> None:
+        """Read and parse the document file, runs on a worker thread."""
+        try:
+            # Load file content with one sized read, decoded once in the common UTF-8 case
+            with open(self.file_path, 'rb') as file:
+                content = decode_text(file.read())
             
-            # Parse and render content
-            self.render_content(content)
+            self._parse_queue.put(TextProcessor.parse_markdown(content))
+        except Exception as e:
+            self._parse_queue.put(e)
+
+    def poll_parsed_document(self) -> None:
+        """Render the parsed document once the worker thread has finished."""
+        try:
+            result = self._parse_queue.get_nowait()
+        except queue.Empty:
+            self.window.after(DOCUMENT_POLL_INTERVAL, self.poll_parsed_document)
+            return
+        
+        try:
+            if isinstance(result, Exception):
+                raise result
             
             # Update loading status
-            self.loading_window.update_progress(4, 4, "Complete")
-            
-            # Ensure minimum display time
-            self.loading_window.ensure_minimum_time()
-            
-            # Show main window
-            self.window.deiconify()
-            
-            # Destroy loading window
-            self.loading_window.destroy()
-            
-            # Update window title
-            self.update_window_title()
-            
-            # Set window to front and focus to text area
-            self.window.lift()
-            self.window.focus_force()
-            self.text_widget.focus_set()
+            self.loading_window.update_progress(3, 4, "Rendering content...")
             
-            # Wait for window to fully render before updating horizontal line length
-            self.window.after(100, self.update_horizontal_lines)
-            self.window.after(300, self.update_horizontal_lines)
-            self.window.after(500, self.update_horizontal_lines)
+            # Render content, the document is shown once the last batch is inserted
+            self.render_content(result, self.finish_loading)
             
         except Exception as e:
-            # If error occurs, ensure closing loading window
-            if hasattr(self, 'loading_window'):
-                self.loading_window.destroy()
-            messagebox.showerror("Failed to open file", f"Cannot open file {os.path.basename(self.file_path)}:\n{str(e)}")
-            self.close_window()
+            self.show_load_error(e)
+
+    def finish_loading(self) -> None:
+        """Complete loading after the content has been rendered."""
+        # Update loading status
+        self.loading_window.update_progress(4, 4, "Complete")
+        
+        # Show document once the loading window has been displayed long enough
+        self.loading_window.ensure_minimum_time(self.show_document)
+
+    def show_load_error(self, error: Exception) -> None:
+        """Report a failed load and close the viewer.
+        
+        Args:
+            error: Exception raised while loading
+        """
+        # If error occurs, ensure closing loading window
+        if hasattr(self, 'loading_window'):
+            self.loading_window.destroy()
+        messagebox.showerror("Failed to open file", f"Cannot open file {os.path.basename(self.file_path)}:\n{str(error)}")
+        self.close_window()
+
+    def show_document(self) -> None:
+        """Show loaded document and close loading window."""
+        # Show main window
+        self.window.deiconify()
+        
+        # Destroy loading window
+        self.loading_window.destroy()
+        
+        # Update window title
+        self.update_window_title()
+        
+        # Set window to front and focus to text area
+        self.window.lift()
+        self.window.focus_force()
+        self.text_widget.focus_set()
+        
+        # Resolve geometry first so horizontal lines are sized in a single pass
+        self.window.update_idletasks()
+        self.window.after_idle(self.update_horizontal_lines)
 
     def create_text_widget(self) -> None:
         """Create text widget with scrollbar."""
+        # Import StyleManager here to avoid circular import
+        from src.ui.styles import StyleManager
+        
+        # The Chinese font is only registered once a document needs it,
+        # this must happen before Tk resolves any font of that family
+        ensure_font_loaded(CHINESE_FONT)
+        
         # Create text widget
         self.text_widget = tk.Text(
             self.window,
-            font=('Noto Sans SC', self.current_font_size),
+            font=StyleManager.get_font(is_chinese=True, size=self.current_font_size),
             bg=COLORS['background'],
             fg=COLORS['text'],
             insertbackground=COLORS['text'],
@@ -152,16 +206,20 @@ class DocumentViewer:
             padx=PADDING['text'],
             pady=PADDING['text'],
             spacing1=8,
-            cursor='arrow'
+            cursor='arrow',
+            # Read-only view, skip undo bookkeeping and selection export
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            exportselection=False,
+            # Disable text editing
+            state=tk.DISABLED
         )
         self.text_widget.pack(expand=True, fill='both')
         
-        # Configure text tags - Import StyleManager here to avoid circular import
-        from src.ui.styles import StyleManager
+        # Configure text tags
         StyleManager.configure_text_tags(self.text_widget, self.current_font_size)
-        
-        # Disable text editing
-        self.text_widget.config(state=tk.DISABLED)
+        self._applied_font_size = self.current_font_size
         
         # Create scrollbar
         scrollbar = ttk.Scrollbar(self.window, orient=tk.VERTICAL, command=self.text_widget.yview)
@@ -181,31 +239,54 @@ class DocumentViewer:
         # Bind keyboard events
         self.bind_keyboard_events()
 
-    def render_content(self, content: str) -> None:
-        """Render Markdown content in text widget.
+    def render_content(self, parsed_content: List[Tuple[str, str]],
+                       on_complete: Optional[Callable[[], None]] = None) -> None:
+        """Render parsed Markdown content in text widget.
+        
+        Content is inserted in batches of RENDER_BATCH_SIZE runs, each on its
+        own event loop turn, so the loading window stays responsive on large
+        documents.
         
         Args:
-            content: Raw Markdown content
+            parsed_content: List of (text, tag) tuples from TextProcessor.parse_markdown
+            on_complete: Called after the last batch has been inserted
         """
-        # Parse content
-        parsed_content = TextProcessor.parse_markdown(content)
-        
         # Temporarily enable editing
         self.text_widget.config(state=tk.NORMAL)
         self.text_widget.delete('1.0', tk.END)
         
-        # Insert parsed content
-        for char, tag in parsed_content:
-            if tag:
-                if isinstance(tag, tuple):
-                    self.text_widget.insert(tk.END, char, tag)
-                else:
-                    self.text_widget.insert(tk.END, char, tag)
-            else:
-                self.text_widget.insert(tk.END, char)
+        self.render_batch(parsed_content, 0, on_complete)
+
+    def render_batch(self, parsed_content: List[Tuple[str, str]], start: int,
+                     on_complete: Optional[Callable[[], None]]) -> None:
+        """Insert one batch of parsed content and schedule the next one.
         
-        # Re-disable editing
-        self.text_widget.config(state=tk.DISABLED)
+        Args:
+            parsed_content: List of (text, tag) tuples from TextProcessor.parse_markdown
+            start: Index of the first run in this batch
+            on_complete: Called after the last batch has been inserted
+        """
+        try:
+            # Insert the batch as alternating text/tags arguments of a single Tcl call
+            end = start + RENDER_BATCH_SIZE
+            insert_args = []
+            for text, tag in parsed_content[start:end]:
+                insert_args.append(text)
+                insert_args.append(tag or ())
+            if insert_args:
+                self.text_widget.insert(tk.END, *insert_args)
+            
+            if end < len(parsed_content):
+                self.window.after(0, self.render_batch, parsed_content, end, on_complete)
+                return
+            
+            # Re-disable editing
+            self.text_widget.config(state=tk.DISABLED)
+            
+            if on_complete:
+                on_complete()
+        except Exception as e:
+            self.show_load_error(e)
 
     def update_window_title(self) -> None:
         """Update window title with current settings."""
@@ -228,7 +309,8 @@ class DocumentViewer:
             available_width = text_width - (PADDING['text'] * 2)
             
             # Estimate single character width
-            font = tkFont.Font(family='Inter', size=self.current_font_size)
+            from src.ui.styles import StyleManager
+            font = StyleManager.get_font(size=self.current_font_size)
             char_width = font.measure('─')
             
             # Calculate number of characters that can fit
@@ -268,16 +350,19 @@ class DocumentViewer:
 
     def update_font_size(self) -> None:
         """Update font size in text widget."""
-        if hasattr(self, 'text_widget'):
+        if hasattr(self, 'text_widget') and self.current_font_size != self._applied_font_size:
             # Save current scroll position
             current_position = self.text_widget.yview()
             
+            # Import StyleManager here to avoid circular import
+            from src.ui.styles import StyleManager
+            
             # Update font size
-            self.text_widget.configure(font=('Noto Sans SC', self.current_font_size))
+            self.text_widget.configure(font=StyleManager.get_font(is_chinese=True, size=self.current_font_size))
             
-            # Reconfigure text tags - Import StyleManager here to avoid circular import
-            from src.ui.styles import StyleManager
+            # Reconfigure text tags
             StyleManager.configure_text_tags(self.text_widget, self.current_font_size)
+            self._applied_font_size = self.current_font_size
             
             # Restore scroll position
             self.text_widget.yview_moveto(current_position[0])
@@ -285,23 +370,6 @@ class DocumentViewer:
             # Update window title
             self.update_window_title()
 
-    def center_window(self) -> None:
-        """Center window display."""
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        
-        # Get screen dimensions
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
-        
-        # Calculate window position to center it
-        x = (screen_width - width) // 2
-        y = (screen_height - height) // 2
-        
-        # Set window position
-        self.window.geometry(f'{width}x{height}+{x}+{y}')
-
     def bind_keyboard_events(self) -> None:
         """Bind keyboard events."""
         # Disable text widget default left and right key bindings, and rebind for font size adjustment
@@ -316,20 +384,33 @@ class DocumentViewer:
         self.window.bind('<asterisk>', self.increase_opacity)
         self.window.bind('<slash>', self.decrease_opacity)
 
+    def apply_opacity(self) -> None:
+        """Apply the current opacity level, skipping the window manager call if unchanged."""
+        alpha = OPACITY_LEVELS[self.current_opacity_index]
+        if alpha != self._current_alpha:
+            self.window.attributes('-alpha', alpha)
+            self._current_alpha = alpha
+
     def increase_opacity(self, event: Optional[tk.Event] = None) -> str:
         """Increase opacity."""
+        if self.scroll_manager.is_key_repeat_throttled():
+            return 'break'
+        
         if self.current_opacity_index > 0:
             self.current_opacity_index -= 1
-            self.window.attributes('-alpha', OPACITY_LEVELS[self.current_opacity_index])
+            self.apply_opacity()
             self.update_window_title()
             self.config.set("opacity_index", self.current_opacity_index)
         return 'break'
 
     def decrease_opacity(self, event: Optional[tk.Event] = None) -> str:
         """Decrease opacity."""
+        if self.scroll_manager.is_key_repeat_throttled():
+            return 'break'
+        
         if self.current_opacity_index < len(OPACITY_LEVELS) - 1:
             self.current_opacity_index += 1
-            self.window.attributes('-alpha', OPACITY_LEVELS[self.current_opacity_index])
+            self.apply_opacity()
             self.update_window_title()
             self.config.set("opacity_index", self.current_opacity_index)
         return 'break'
@@ -337,7 +418,15 @@ class DocumentViewer:
     def on_window_resize(self, event: Optional[tk.Event] = None) -> None:
         """Handle window size change event."""
         if event and event.widget == self.window:
-            self.update_horizontal_lines()
+            # Only update once the window has stopped resizing
+            if self._resize_after_id:
+                self.window.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.window.after(RESIZE_DEBOUNCE_DELAY, self.on_resize_finished)
+
+    def on_resize_finished(self) -> None:
+        """Update layout after window resizing has settled."""
+        self._resize_after_id = None
+        self.update_horizontal_lines()
 
     def update_horizontal_lines(self) -> None:
         """Update length of all horizontal lines."""
@@ -346,9 +435,19 @@ class DocumentViewer:
             ranges = self.text_widget.tag_ranges('horizontal_line')
             if not ranges:
                 return
+            
+            # Window not laid out yet, try again shortly. Once the retries run
+            # out, the debounced <Configure> handler draws the lines instead.
+            if self.text_widget.winfo_width() <= 1:
+                if self._horizontal_line_retries > 0:
+                    self._horizontal_line_retries -= 1
+                    self.window.after(50, self.update_horizontal_lines)
+                return
                 
-            # Calculate new horizontal line length
+            # Calculate new horizontal line length, nothing to do if it didn't change
             line_length = self.calculate_horizontal_line_length()
+            if line_length == self._horizontal_line_length:
+                return
             
             # Temporarily enable editing
             self.text_widget.config(state=tk.NORMAL)
@@ -361,14 +460,16 @@ class DocumentViewer:
                 # Get content of current line
                 current_line = self.text_widget.get(start, end).strip()
                 
-                # Process only horizontal lines (lines composed of ─ characters)
-                if all(c == '─' for c in current_line):
+                # Process only horizontal lines (lines composed of ─ characters),
+                # quote bars share the horizontal_line tag
+                if not current_line.strip('─'):
                     # Replace with new length horizontal line
                     self.text_widget.delete(start, end)
                     self.text_widget.insert(start, '─' * line_length, 'horizontal_line')
             
             # Re-disable editing
             self.text_widget.config(state=tk.DISABLED)
+            self._horizontal_line_length = line_length
         except Exception:
             pass  # Silently ignore horizontal line update errors
 
@@ -381,22 +482,23 @@ class DocumentViewer:
                 self.scroll_manager.text_widget.after_cancel(self.scroll_manager.scroll_id)
                 self.scroll_manager.scroll_id = None
         
-        # Save window size
+        # Cancel pending resize update
+        if self._resize_after_id:
+            self.window.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        
+        # Save window size once on close, never while resizing
         try:
-            # Get current window size
-            geometry = self.window.geometry()
-            # Parse geometry string (e.g., "900x700+100+100")
-            size_part = geometry.split('+')[0]  # Get "900x700" part
-            width, height = map(int, size_part.split('x'))
-            
-            # Save window size setting
             self.config.update_multiple({
-                "window_width": width,
-                "window_height": height
+                "window_width": self.window.winfo_width(),
+                "window_height": self.window.winfo_height()
             })
         except Exception:
             pass  # Silently ignore window size save errors
         
+        # Write any settings changes still waiting for the save delay
+        self.config.flush()
+        
         self.window.destroy()
         # Re-show main window
         self.parent.deiconify() 
\ No newline at end of file
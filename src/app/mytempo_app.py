@@ -2,13 +2,16 @@
 Main application class for MyTempo.
 """
 
+import queue
+import threading
 from typing import List
 
 import tkinter as tk
 
 from src.ui.loading_window import LoadingWindow
 from src.ui.upload_interface import UploadInterface
-from src.utils.font_loader import load_fonts
+from src.utils.constants import ENGLISH_FONT
+from src.utils.font_loader import fonts_loaded, load_deferred_fonts, load_fonts
 
 __version__ = '0.5.3'  # No console window, improved Windows compatibility
 
@@ -17,27 +20,49 @@ class MyTempoApp:
     
     def __init__(self) -> None:
         """Initialize MyTempo application."""
+        # Start loading fonts first so font registration overlaps Tk startup.
+        # Only the upload interface font is needed now, the document font is
+        # registered when the first document is opened.
+        font_progress: queue.Queue = queue.Queue()
+        threading.Thread(
+            target=load_fonts,
+            args=(lambda *progress: font_progress.put(progress), {ENGLISH_FONT}),
+            daemon=True
+        ).start()
+        
         # Create main window first but don't show it
         self.root = tk.Tk()
         self.root.withdraw()
         
-        # Show loading window
-        loading_window = LoadingWindow(self.root, "Loading Fonts")
-        
-        # Load fonts
-        load_fonts(loading_window.update_progress)
+        # Show loading window, it keeps redrawing while fonts load in the background
+        loading_window = LoadingWindow(self.root, "Loading Fonts", font_progress)
+        loading_window.wait_for(fonts_loaded, lambda: self.finish_startup(loading_window))
         
-        # Ensure minimum display time
-        loading_window.ensure_minimum_time()
+    def finish_startup(self, loading_window: LoadingWindow) -> None:
+        """Create the main interface once fonts are loaded.
         
-        # Create upload interface
+        Args:
+            loading_window: Loading window shown during startup
+        """
+        # Create upload interface while the loading window is still shown
         self.upload_interface = UploadInterface(self.root, self.on_file_selected)
         
-        # Close loading window and show main window
+        # Show main window once the loading window has been displayed long enough
+        loading_window.ensure_minimum_time(lambda: self.show_main_window(loading_window))
+        
+    def show_main_window(self, loading_window: LoadingWindow) -> None:
+        """Close loading window and show main window.
+        
+        Args:
+            loading_window: Loading window shown during startup
+        """
         loading_window.destroy()
         self.root.deiconify()
         self.root.focus_force()
         
+        # Register the remaining fonts while the user picks a file
+        threading.Thread(target=load_deferred_fonts, daemon=True).start()
+        
     def on_file_selected(self, file_paths: List[str]) -> None:
         """Handle file selection.
         
@@ -2,26 +2,54 @@
 Configuration management for MyTempo application.
 """
 
+import atexit
 import json
 import os
-from typing import Any, Dict
+import tkinter as tk
+from typing import Any, Dict, Optional
 
-from src.utils.constants import (CONFIG_FILE, DEFAULT_FONT_SIZE,
-                                 DEFAULT_OPACITY_INDEX, DEFAULT_SPEED_INDEX,
-                                 DEFAULT_WINDOW_HEIGHT, DEFAULT_WINDOW_WIDTH)
+from src.utils.constants import (CONFIG_FILE, CONFIG_SAVE_DELAY,
+                                 DEFAULT_FONT_SIZE, DEFAULT_OPACITY_INDEX,
+                                 DEFAULT_SPEED_INDEX, DEFAULT_WINDOW_HEIGHT,
+                                 DEFAULT_WINDOW_WIDTH)
 
 APP_VERSION = '0.5.3'  # No console window, improved Windows compatibility
 
 class UserConfig:
     """User configuration management class"""
     
-    def __init__(self, config_file: str = CONFIG_FILE) -> None:
+    # Shared instance per config file
+    _instances: Dict[str, 'UserConfig'] = {}
+    
+    def __new__(cls, config_file: str = CONFIG_FILE, root: Optional[tk.Misc] = None) -> 'UserConfig':
+        """Return the shared configuration manager for config_file."""
+        instance = cls._instances.get(config_file)
+        if instance is None:
+            instance = cls._instances[config_file] = super().__new__(cls)
+        return instance
+    
+    def __init__(self, config_file: str = CONFIG_FILE, root: Optional[tk.Misc] = None) -> None:
         """Initialize configuration manager.
         
+        The settings file is only read again if it changed on disk since
+        it was last loaded or saved.
+        
         Args:
             config_file: Path to configuration file
+            root: Window used to schedule delayed saves, settings are saved immediately without it
         """
+        if hasattr(self, 'settings'):
+            if root is not None:
+                self.root = root
+            # Unsaved changes are newer than the file
+            if not self._dirty and self.get_file_mtime() != self._file_mtime:
+                self.settings = self.load_settings()
+            return
+        
         self.config_file = config_file
+        self.root = root
+        self._dirty = False
+        self._flush_after_id: Optional[str] = None
         self.default_settings = {
             "font_size": DEFAULT_FONT_SIZE,
             "speed_index": DEFAULT_SPEED_INDEX,
@@ -30,6 +58,20 @@ class UserConfig:
             "window_height": DEFAULT_WINDOW_HEIGHT
         }
         self.settings = self.load_settings()
+        
+        # Write pending changes even if the window is closed abruptly
+        atexit.register(self.flush)
+    
+    def get_file_mtime(self) -> Optional[int]:
+        """Get modification time of config file.
+        
+        Returns:
+            Modification time in nanoseconds, None if the file doesn't exist
+        """
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
     
     def load_settings(self) -> Dict[str, Any]:
         """Load settings from config file.
@@ -37,6 +79,7 @@ class UserConfig:
         Returns:
             Dictionary containing user settings with defaults merged
         """
+        self._file_mtime = self.get_file_mtime()
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r', encoding='utf-8') as f:
@@ -52,9 +95,11 @@ class UserConfig:
     
     def save_settings(self) -> None:
         """Save settings to config file."""
+        self._dirty = False
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            self._file_mtime = self.get_file_mtime()
         except Exception:
             pass  # Silently ignore save errors
     
@@ -71,14 +116,33 @@ class UserConfig:
         return self.settings.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
-        """Set value and save to file.
+        """Set value and schedule saving to file.
+        
+        Repeated changes within CONFIG_SAVE_DELAY are written to disk once.
         
         Args:
             key: Setting key
             value: Setting value
         """
         self.settings[key] = value
-        self.save_settings()
+        self._dirty = True
+        
+        if self.root is None:
+            self.flush()
+        elif self._flush_after_id is None:
+            self._flush_after_id = self.root.after(CONFIG_SAVE_DELAY, self.flush)
+    
+    def flush(self) -> None:
+        """Save pending changes to config file."""
+        if self._flush_after_id is not None:
+            try:
+                self.root.after_cancel(self._flush_after_id)
+            except tk.TclError:
+                pass  # Window already destroyed
+            self._flush_after_id = None
+        
+        if self._dirty:
+            self.save_settings()
     
     def update_multiple(self, updates: Dict[str, Any]) -> None:
         """Batch update settings.
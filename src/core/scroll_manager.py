@@ -5,11 +5,13 @@ Scroll management for MyTempo document viewer.
 import platform
 import re
 import subprocess
+import time
 import tkinter as tk
 from typing import Callable, Optional
 import sys
 
-from src.utils.constants import BASE_SPEED, SCROLL_INTERVAL, SCROLL_SPEEDS
+from src.utils.constants import (BASE_SPEED, KEY_REPEAT_INTERVAL, MAX_SCROLL_CATCH_UP,
+                                 SCROLL_INTERVAL, SCROLL_SPEEDS)
 
 
 class ScrollManager:
@@ -26,6 +28,8 @@ class ScrollManager:
         self.config = config
         self.is_scrolling = False
         self.scroll_id: Optional[str] = None
+        self._last_scroll_time = 0.0
+        self._last_key_step = 0.0
         self.current_speed_index = config.get("speed_index", 0)
         self.presentation_remote_detected = False
         
@@ -104,6 +108,8 @@ class ScrollManager:
         """Toggle smooth scroll on/off."""
         if not self.is_scrolling:
             self.is_scrolling = True
+            # Start one interval back so the first step moves a normal distance
+            self._last_scroll_time = time.monotonic() - SCROLL_INTERVAL / 1000
             self.smooth_scroll()
         else:
             self.is_scrolling = False
@@ -193,6 +199,9 @@ class ScrollManager:
         Returns:
             'break' to prevent default behavior
         """
+        if self.is_key_repeat_throttled():
+            return 'break'
+        
         if self.current_speed_index < len(SCROLL_SPEEDS) - 1:
             self.current_speed_index += 1
             self.config.set("speed_index", self.current_speed_index)
@@ -210,6 +219,9 @@ class ScrollManager:
         Returns:
             'break' to prevent default behavior
         """
+        if self.is_key_repeat_throttled():
+            return 'break'
+        
         if self.current_speed_index > 0:
             self.current_speed_index -= 1
             self.config.set("speed_index", self.current_speed_index)
@@ -218,6 +230,21 @@ class ScrollManager:
                 self.parent_window.update_window_title()
         return 'break'
     
+    def is_key_repeat_throttled(self) -> bool:
+        """Check whether an adjustment key event arrived too soon after the last one.
+        
+        The viewer's opacity keys use the same check, so all held
+        adjustment keys share one rate limit.
+        
+        Returns:
+            True if the event should be ignored
+        """
+        now = time.monotonic()
+        if now - self._last_key_step < KEY_REPEAT_INTERVAL:
+            return True
+        self._last_key_step = now
+        return False
+    
     def get_current_speed_multiplier(self) -> int:
         """Get current speed multiplier.
         
@@ -227,16 +254,29 @@ class ScrollManager:
         return SCROLL_SPEEDS[self.current_speed_index]
     
     def smooth_scroll(self) -> None:
-        """Execute smooth scroll step."""
+        """Execute smooth scroll step.
+        
+        The step is scaled by the time since the previous step, so the scroll
+        speed doesn't depend on timer jitter. The scale is capped, so the
+        view doesn't jump after the event loop was blocked.
+        """
+        self.scroll_id = None
         if self.is_scrolling:
             # Get current scroll position
             current_pos = self.text_widget.yview()[0]
             
             # If not at bottom, continue scrolling
             if current_pos < 1.0:
+                now = time.monotonic()
+                elapsed_intervals = min(
+                    (now - self._last_scroll_time) / (SCROLL_INTERVAL / 1000),
+                    MAX_SCROLL_CATCH_UP
+                )
+                self._last_scroll_time = now
+                
                 # Use current speed multiplier to calculate actual scroll speed
                 speed_multiplier = SCROLL_SPEEDS[self.current_speed_index]
-                current_speed = BASE_SPEED * speed_multiplier
+                current_speed = BASE_SPEED * speed_multiplier * elapsed_intervals
                 self.text_widget.yview_moveto(current_pos + current_speed)
                 self.scroll_id = self.text_widget.after(SCROLL_INTERVAL, self.smooth_scroll)
             else:
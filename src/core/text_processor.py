@@ -3,57 +3,58 @@ Text processing and Markdown parsing for MyTempo application.
 """
 
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+
+# Line endings, str.splitlines would also break at form feeds and Unicode separators
+LINE_BREAK_PATTERN = re.compile(r'\r\n|\r|\n')
+
+# Runs of Chinese characters (group 1) or of any other characters
+SCRIPT_RUN_PATTERN = re.compile(r'([\u4e00-\u9fff]+)|[^\u4e00-\u9fff]+')
+
+# Heading line, group 1 holds one '#' per level and group 2 the stripped title
+HEADING_PATTERN = re.compile(r'(#{1,6}) \s*(.*?)\s*$')
+
+# Quote line, group 1 holds the stripped quote text
+QUOTE_PATTERN = re.compile(r'> \s*(.*?)\s*$')
+
+# Inline Markdown formats, group names are used as format tags
+FORMAT_PATTERN = re.compile(r'\*\*(?P<bold>.*?)\*\*|==(?P<highlight>.*?)==|[*_](?P<italic>.*?)[*_]')
 
 
 class TextProcessor:
     """Handles text processing and Markdown parsing"""
     
-    @staticmethod
-    def is_chinese_char(char: str) -> bool:
-        """Check if character is Chinese.
-        
-        Args:
-            char: Character to check
-            
-        Returns:
-            True if character is Chinese
-        """
-        return '\u4e00' <= char <= '\u9fff'
+    # (Chinese, English) tag names for heading levels 1-6
+    HEADING_TAGS = tuple((f'zh_h{level}', f'en_h{level}') for level in range(1, 7))
     
     @staticmethod
-    def get_font_tag(char: str, base_tag: str = '') -> str:
-        """Get appropriate font tag for character.
+    def split_script_runs(text: str) -> Iterator[Tuple[bool, str]]:
+        """Split text into runs of Chinese and non-Chinese characters.
         
         Args:
-            char: Character to get font for
-            base_tag: Base tag to append to
+            text: Text to split
             
         Returns:
-            Font tag string
+            Iterator of (is_chinese, run) tuples
         """
-        prefix = 'zh' if TextProcessor.is_chinese_char(char) else 'en'
-        return f'{prefix}_{base_tag}' if base_tag else prefix
+        for match in SCRIPT_RUN_PATTERN.finditer(text):
+            yield match.lastindex == 1, match.group()
     
     @staticmethod
-    def process_heading(line: str, level: int) -> List[Tuple[str, str]]:
+    def process_heading(title_text: str, level: int) -> List[Tuple[str, str]]:
         """Process heading line.
         
         Args:
-            line: Line content
+            title_text: Heading text without markers and surrounding spaces
             level: Heading level (1-6)
             
         Returns:
-            List of (character, tag) tuples
+            List of (text, tag) tuples
         """
-        # Remove heading markers
-        marker_length = level + 1  # # for level 1, ## for level 2, etc.
-        title_text = line[marker_length:].strip()
-        
+        zh_tag, en_tag = TextProcessor.HEADING_TAGS[level - 1]
         result = []
-        for char in title_text:
-            tag = TextProcessor.get_font_tag(char, f'h{level}')
-            result.append((char, tag))
+        for is_chinese, run in TextProcessor.split_script_runs(title_text):
+            result.append((run, zh_tag if is_chinese else en_tag))
         result.append(('\n', ''))
         
         return result
@@ -63,21 +64,20 @@ class TextProcessor:
         """Process horizontal line.
         
         Returns:
-            List of (character, tag) tuples
+            List of (text, tag) tuples
         """
         return [('─' * 10, 'horizontal_line'), ('\n', '')]
     
     @staticmethod
-    def process_quote(line: str) -> List[Tuple[str, str]]:
+    def process_quote(quote_text: str) -> List[Tuple[str, str]]:
         """Process quoted text.
         
         Args:
-            line: Line content
+            quote_text: Quote text without marker and surrounding spaces
             
         Returns:
-            List of (character, tag) tuples
+            List of (text, tag) tuples
         """
-        quote_text = line[2:].strip()  # Remove > and spaces
         result = []
         
         # Add quote indicator
@@ -99,69 +99,43 @@ class TextProcessor:
             base_tags: Base tags to apply
             
         Returns:
-            List of (character, tag) tuples
+            List of (text, tag) tuples
         """
         if base_tags is None:
             base_tags = []
         
         def apply_format(text: str, tags: List[str]) -> List[Tuple[str, str]]:
             """Apply format to text."""
+            # Process tag combination
+            all_tags = tags + base_tags
+            tag_combination = '_'.join(sorted(all_tags))
+            
             result = []
-            for char in text:
-                char_tags = []
-                if TextProcessor.is_chinese_char(char):
-                    base = 'zh'
-                else:
-                    base = 'en'
-                
-                # Process tag combination
-                all_tags = tags + base_tags
-                if all_tags:
-                    tag_combination = '_'.join(sorted(all_tags))
-                    char_tags.append(f'{base}_{tag_combination}')
-                else:
-                    char_tags.append(base)
-                
-                result.append((char, char_tags[0]))
+            for is_chinese, run in TextProcessor.split_script_runs(text):
+                base = 'zh' if is_chinese else 'en'
+                result.append((run, f'{base}_{tag_combination}' if all_tags else base))
             return result
         
         def process_formats(text: str, current_tags: List[str]) -> List[Tuple[str, str]]:
             """Process text format recursively."""
-            # Try to match different formats
-            bold_match = re.search(r'\*\*(.*?)\*\*', text)
-            highlight_match = re.search(r'==(.*?)==', text)
-            italic_match = re.search(r'[*_](.*?)[*_]', text)
-            
-            if not any([bold_match, highlight_match, italic_match]):
-                # If no format mark is found, output text directly
-                return apply_format(text, current_tags)
-            
-            # Select the first found format mark
-            matches = []
-            if bold_match:
-                matches.append(('bold', bold_match))
-            if highlight_match:
-                matches.append(('highlight', highlight_match))
-            if italic_match:
-                matches.append(('italic', italic_match))
-            
-            # Sort by start position
-            matches.sort(key=lambda x: x[1].start())
-            format_type, match = matches[0]
-            
             result = []
+            position = 0
             
-            # Process text before format mark
-            if match.start() > 0:
-                result.extend(apply_format(text[:match.start()], current_tags))
-            
-            # Process text with format
-            inner_text = match.group(1)
-            result.extend(process_formats(inner_text, current_tags + [format_type]))
+            # Alternatives are tried left to right, so the earliest mark wins
+            # and bold takes precedence over italic at the same position
+            for match in FORMAT_PATTERN.finditer(text):
+                # Process text before format mark
+                if match.start() > position:
+                    result.extend(apply_format(text[position:match.start()], current_tags))
+                
+                # Process text with format
+                format_type = match.lastgroup
+                result.extend(process_formats(match.group(format_type), current_tags + [format_type]))
+                position = match.end()
             
-            # Process text after format mark
-            if match.end() < len(text):
-                result.extend(process_formats(text[match.end():], current_tags))
+            # Process text after the last format mark
+            if position < len(text):
+                result.extend(apply_format(text[position:], current_tags))
             
             return result
         
@@ -175,7 +149,7 @@ class TextProcessor:
             line: Line content
             
         Returns:
-            List of (character, tag) tuples
+            List of (text, tag) tuples
         """
         if not line:
             return [('\n', '')]
@@ -186,34 +160,34 @@ class TextProcessor:
     
     @staticmethod
     def parse_markdown(content: str) -> List[Tuple[str, str]]:
-        """Parse Markdown content into formatted characters.
+        """Parse Markdown content into formatted text runs.
         
         Args:
             content: Raw Markdown content
             
         Returns:
-            List of (character, tag) tuples
+            List of (text, tag) tuples
         """
-        lines = content.split('\n')
         result = []
         
+        # Split on \r\n, \r and \n endings, dropping the empty string after a final newline
+        lines = LINE_BREAK_PATTERN.split(content)
+        if not lines[-1]:
+            lines.pop()
+        
         for line in lines:
-            if line.startswith('# '):
-                result.extend(TextProcessor.process_heading(line, 1))
-            elif line.startswith('## '):
-                result.extend(TextProcessor.process_heading(line, 2))
-            elif line.startswith('### '):
-                result.extend(TextProcessor.process_heading(line, 3))
-            elif line.startswith('#### '):
-                result.extend(TextProcessor.process_heading(line, 4))
-            elif line.startswith('##### '):
-                result.extend(TextProcessor.process_heading(line, 5))
-            elif line.startswith('###### '):
-                result.extend(TextProcessor.process_heading(line, 6))
+            # Blank lines need no Markdown checks
+            if not line:
+                result.append(('\n', ''))
+                continue
+            
+            if heading_match := HEADING_PATTERN.match(line):
+                marks, title_text = heading_match.groups()
+                result.extend(TextProcessor.process_heading(title_text, len(marks)))
             elif line == '---':
                 result.extend(TextProcessor.process_horizontal_line())
-            elif line.startswith('> '):
-                result.extend(TextProcessor.process_quote(line))
+            elif quote_match := QUOTE_PATTERN.match(line):
+                result.extend(TextProcessor.process_quote(quote_match.group(1)))
             else:
                 result.extend(TextProcessor.process_normal_line(line))
         
@@ -2,26 +2,33 @@
 Loading window for MyTempo application.
 """
 
+import queue
+import threading
 import time
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
-from src.utils.constants import (COLORS, LOADING_COMPLETE_DELAY,
-                                 MIN_LOADING_TIME)
+from src.utils.constants import (COLORS, FONT_LOADING_POLL_INTERVAL,
+                                 MIN_LOADING_TIME, PROGRESS_REDRAW_INTERVAL)
+from src.utils.window_geometry import center_on_screen
 
 
 class LoadingWindow:
     """Loading window with progress bar"""
     
-    def __init__(self, parent: Optional[tk.Tk] = None, title: str = "Loading") -> None:
+    def __init__(self, parent: Optional[tk.Tk] = None, title: str = "Loading",
+                 progress_queue: Optional[queue.Queue] = None) -> None:
         """Initialize loading window.
         
         Args:
             parent: Parent window
             title: Loading window title
+            progress_queue: Queue of (current, total, item_name) tuples filled
+                by a worker thread, a new queue is created when None
         """
         self.parent = parent
+        self.progress_queue: queue.Queue = progress_queue if progress_queue is not None else queue.Queue()
         if parent:
             self.root = tk.Toplevel(parent)
         else:
@@ -31,19 +38,7 @@ class LoadingWindow:
         self.root.title(title)
         
         # Set window size and position
-        window_width = 400
-        window_height = 180
-        
-        # Get screen dimensions
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        
-        # Calculate window position to center it
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        
-        # Set window size and position
-        self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        center_on_screen(self.root, 400, 180)
         
         # Set window style
         self.root.configure(bg=COLORS['white'])
@@ -58,18 +53,20 @@ class LoadingWindow:
         )
         self.frame.place(relx=0.5, rely=0.5, anchor='center', relwidth=0.9, relheight=0.85)
         
+        # Import StyleManager here to avoid circular import
+        from src.ui.styles import StyleManager
+        
         # Loading text
         self.loading_label = tk.Label(
             self.frame,
             text=title + "...",
-            font=('Inter', 14, 'bold'),
+            font=StyleManager.get_font(size=14, weight='bold'),
             bg=COLORS['white'],
             fg=COLORS['text_primary']
         )
         self.loading_label.pack(pady=(25, 15))
         
         # Progress bar
-        from src.ui.styles import StyleManager
         progress_style = StyleManager.configure_progress_bar_style()
         
         self.progress_var = tk.DoubleVar()
@@ -87,15 +84,20 @@ class LoadingWindow:
         self.item_label = tk.Label(
             self.frame,
             text="Preparing...",
-            font=('Inter', 10),
+            font=StyleManager.get_font(size=10),
             bg=COLORS['white'],
             fg=COLORS['text_secondary'],
             wraplength=280
         )
         self.item_label.pack(pady=(0, 20))
         
+        # Last shown progress, unchanged updates are skipped
+        self._last_percent = -1
+        self._last_item_name: Optional[str] = None
+        self._last_redraw_time = 0.0
+        
         self.start_time = time.time()
-        self.root.update()
+        self.root.update_idletasks()  # Resolve geometry, deiconify does the first paint
         self.root.deiconify()  # Show window
         
     def update_progress(self, current: int, total: int, item_name: str) -> None:
@@ -107,24 +109,69 @@ class LoadingWindow:
             item_name: Current item name
         """
         progress = (current / total) * 100
+        percent = int(progress)
+        if percent == self._last_percent and item_name == self._last_item_name:
+            return
+        self._last_percent = percent
+        self._last_item_name = item_name
+        
         self.progress_var.set(progress)
         self.item_label.config(text=f"Loading: {item_name}")
-        self.root.update()
         
-    def ensure_minimum_time(self) -> None:
-        """Ensure loading window displays for minimum time."""
+        # Redraw at most once per interval, the event loop draws the rest
+        now = time.monotonic()
+        if (now - self._last_redraw_time) * 1000 >= PROGRESS_REDRAW_INTERVAL:
+            self._last_redraw_time = now
+            self.root.update_idletasks()  # Redraw only, don't dispatch input events
+        
+    def wait_for(self, done: threading.Event, on_done: Callable[[], None]) -> None:
+        """Show queued progress until a worker thread signals completion.
+        
+        The check is rescheduled on the event loop, so the window keeps
+        redrawing and handling events while the worker runs.
+        
+        Args:
+            done: Event set by the worker once it has finished
+            on_done: Called on the Tk thread after the last progress update
+        """
+        # Read the flag before draining so no update queued before it is missed
+        finished = done.is_set()
+        
+        latest: Optional[Tuple[int, int, str]] = None
+        while True:
+            try:
+                latest = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest:
+            self.update_progress(*latest)
+        
+        if finished:
+            # Draw the final state, updates may have been skipped by the redraw limit
+            self.root.update_idletasks()
+            on_done()
+        else:
+            self.root.after(FONT_LOADING_POLL_INTERVAL, self.wait_for, done, on_done)
+        
+    def ensure_minimum_time(self, on_complete: Callable[[], None]) -> None:
+        """Ensure loading window displays for minimum time.
+        
+        The completed state is shown right away and the remaining wait is
+        scheduled on the event loop, so the window keeps redrawing.
+        
+        Args:
+            on_complete: Called once the loading window has been shown long enough
+        """
+        self.show_complete()
         elapsed_time = time.time() - self.start_time
-        min_display_time = MIN_LOADING_TIME
+        remaining = max(MIN_LOADING_TIME - elapsed_time, 0)
+        self.root.after(int(remaining * 1000), on_complete)
         
-        if elapsed_time < min_display_time:
-            remaining = min_display_time - elapsed_time
-            time.sleep(remaining)
-            
-        # Show 100% completion before closing
+    def show_complete(self) -> None:
+        """Show 100% completion."""
         self.progress_var.set(100)
         self.item_label.config(text="Loading Complete")
-        self.root.update()
-        time.sleep(LOADING_COMPLETE_DELAY)
+        self.root.update_idletasks()  # Always show 100%, even if the last update was throttled
         
     def destroy(self) -> None:
         """Destroy loading window and return focus to parent window."""
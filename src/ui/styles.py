@@ -2,9 +2,11 @@
 UI styles and theme management for MyTempo application.
 """
 
+import functools
 import tkinter as tk
+import tkinter.font as tkFont
 from tkinter import ttk
-from typing import Tuple
+from typing import Dict, Tuple
 
 from src.utils.constants import CHINESE_FONT, COLORS, ENGLISH_FONT, PADDING
 
@@ -12,9 +14,27 @@ from src.utils.constants import CHINESE_FONT, COLORS, ENGLISH_FONT, PADDING
 class StyleManager:
     """Manages UI styles and themes"""
     
+    # Font size multipliers for heading levels 1-6
+    HEADING_MULTIPLIERS = (2.0, 1.5, 1.25, 1.1, 1.0, 0.9)
+    
+    # Shared Tk fonts keyed by (family, size, weight, slant)
+    _font_cache: Dict[Tuple[str, int, str, str], tkFont.Font] = {}
+    
+    # ttk styles live in the Tk interpreter, so they only need configuring once
+    _styles_configured = False
+    
+    PROGRESS_BAR_STYLE = "Custom.Horizontal.TProgressbar"
+    
     @staticmethod
     def setup_styles() -> None:
-        """Set up Apple-style UI styles."""
+        """Set up Apple-style UI styles.
+        
+        Both the button and progress bar styles are configured on the first
+        call, later calls return immediately.
+        """
+        if StyleManager._styles_configured:
+            return
+        
         style = ttk.Style()
         
         # Configure Apple-style button
@@ -28,9 +48,19 @@ class StyleManager:
         style.map('Apple.TButton',
                  background=[('active', COLORS['primary_hover']),
                            ('pressed', COLORS['primary_pressed'])])
+        
+        # Configure progress bar
+        style.configure(
+            StyleManager.PROGRESS_BAR_STYLE,
+            troughcolor=COLORS['main_bg'],
+            background=COLORS['primary'],
+            thickness=6
+        )
+        
+        StyleManager._styles_configured = True
     
     @staticmethod
-    def get_font(is_chinese: bool = False, size: int = 12, weight: str = 'normal') -> Tuple[str, int, str]:
+    def get_font(is_chinese: bool = False, size: int = 12, weight: str = 'normal') -> tkFont.Font:
         """Get appropriate font configuration.
         
         Args:
@@ -39,9 +69,33 @@ class StyleManager:
             weight: Font weight
             
         Returns:
-            Font configuration tuple
+            Shared Tk font, see get_tk_font
+        """
+        return StyleManager.get_tk_font(CHINESE_FONT if is_chinese else ENGLISH_FONT, size, weight)
+    
+    @staticmethod
+    def get_tk_font(family: str, size: int, weight: str = 'normal', slant: str = 'roman') -> tkFont.Font:
+        """Get a shared Tk font object.
+        
+        Fonts are created once per configuration and reused, so Tk keeps
+        the resolved platform font instead of resolving a font tuple again.
+        
+        Args:
+            family: Font family
+            size: Font size
+            weight: Font weight
+            slant: Font slant
+            
+        Returns:
+            Cached Tk font
         """
-        return (CHINESE_FONT if is_chinese else ENGLISH_FONT, size, weight)
+        key = (family, size, weight, slant)
+        font = StyleManager._font_cache.get(key)
+        if font is None:
+            font = StyleManager._font_cache[key] = tkFont.Font(
+                family=family, size=size, weight=weight, slant=slant
+            )
+        return font
     
     @staticmethod
     def configure_text_tags(text_widget: tk.Text, font_size: int) -> None:
@@ -51,73 +105,57 @@ class StyleManager:
             text_widget: Text widget to configure
             font_size: Base font size
         """
-        # Configure basic tags
-        text_widget.tag_configure('zh', font=(CHINESE_FONT, font_size))
-        text_widget.tag_configure('en', font=(ENGLISH_FONT, font_size))
-        
-        # Configure single effect tags
-        text_widget.tag_configure('zh_bold', font=(CHINESE_FONT, font_size, 'bold'))
-        text_widget.tag_configure('en_bold', font=(ENGLISH_FONT, font_size, 'bold'))
-        
-        text_widget.tag_configure('zh_italic', font=(CHINESE_FONT, font_size, 'italic'))
-        text_widget.tag_configure('en_italic', font=(ENGLISH_FONT, font_size, 'italic'))
-        
-        text_widget.tag_configure('zh_highlight', 
-                                font=(CHINESE_FONT, font_size), 
-                                background=COLORS['highlight'])
-        text_widget.tag_configure('en_highlight', 
-                                font=(ENGLISH_FONT, font_size), 
-                                background=COLORS['highlight'])
-        
-        # Configure combined effect tags
-        text_widget.tag_configure('zh_bold_highlight', 
-                                font=(CHINESE_FONT, font_size, 'bold'), 
-                                background=COLORS['highlight'])
-        text_widget.tag_configure('en_bold_highlight', 
-                                font=(ENGLISH_FONT, font_size, 'bold'), 
-                                background=COLORS['highlight'])
-        
-        text_widget.tag_configure('zh_italic_highlight', 
-                                font=(CHINESE_FONT, font_size, 'italic'), 
-                                background=COLORS['highlight'])
-        text_widget.tag_configure('en_italic_highlight', 
-                                font=(ENGLISH_FONT, font_size, 'italic'), 
-                                background=COLORS['highlight'])
-        
-        text_widget.tag_configure('zh_bold_italic', 
-                                font=(CHINESE_FONT, font_size, 'bold italic'))
-        text_widget.tag_configure('en_bold_italic', 
-                                font=(ENGLISH_FONT, font_size, 'bold italic'))
-        
-        text_widget.tag_configure('zh_bold_italic_highlight', 
-                                font=(CHINESE_FONT, font_size, 'bold italic'), 
-                                background=COLORS['highlight'])
-        text_widget.tag_configure('en_bold_italic_highlight', 
-                                font=(ENGLISH_FONT, font_size, 'bold italic'), 
-                                background=COLORS['highlight'])
-        
-        # Configure other tags
-        text_widget.tag_configure('horizontal_line', 
-                                font=(ENGLISH_FONT, font_size), 
-                                foreground=COLORS['horizontal_line'])
+        get_font = StyleManager.get_tk_font
+        highlight = COLORS['highlight']
         
-        # Configure quote tag
-        text_widget.tag_configure('zh_quote', 
-                                font=(CHINESE_FONT, font_size, 'bold'), 
-                                lmargin1=20, lmargin2=20)
-        text_widget.tag_configure('en_quote', 
-                                font=(ENGLISH_FONT, font_size, 'bold'), 
-                                lmargin1=20, lmargin2=20)
+        tag_options = [
+            # Basic tags
+            ('zh', {'font': get_font(CHINESE_FONT, font_size)}),
+            ('en', {'font': get_font(ENGLISH_FONT, font_size)}),
+            
+            # Single effect tags
+            ('zh_bold', {'font': get_font(CHINESE_FONT, font_size, 'bold')}),
+            ('en_bold', {'font': get_font(ENGLISH_FONT, font_size, 'bold')}),
+            ('zh_italic', {'font': get_font(CHINESE_FONT, font_size, slant='italic')}),
+            ('en_italic', {'font': get_font(ENGLISH_FONT, font_size, slant='italic')}),
+            ('zh_highlight', {'font': get_font(CHINESE_FONT, font_size), 'background': highlight}),
+            ('en_highlight', {'font': get_font(ENGLISH_FONT, font_size), 'background': highlight}),
+            
+            # Combined effect tags
+            ('zh_bold_highlight', {'font': get_font(CHINESE_FONT, font_size, 'bold'), 'background': highlight}),
+            ('en_bold_highlight', {'font': get_font(ENGLISH_FONT, font_size, 'bold'), 'background': highlight}),
+            ('zh_italic_highlight', {'font': get_font(CHINESE_FONT, font_size, slant='italic'), 'background': highlight}),
+            ('en_italic_highlight', {'font': get_font(ENGLISH_FONT, font_size, slant='italic'), 'background': highlight}),
+            ('zh_bold_italic', {'font': get_font(CHINESE_FONT, font_size, 'bold', 'italic')}),
+            ('en_bold_italic', {'font': get_font(ENGLISH_FONT, font_size, 'bold', 'italic')}),
+            ('zh_bold_italic_highlight', {'font': get_font(CHINESE_FONT, font_size, 'bold', 'italic'), 'background': highlight}),
+            ('en_bold_italic_highlight', {'font': get_font(ENGLISH_FONT, font_size, 'bold', 'italic'), 'background': highlight}),
+            
+            # Other tags
+            ('horizontal_line', {'font': get_font(ENGLISH_FONT, font_size), 'foreground': COLORS['horizontal_line']}),
+            
+            # Quote tags
+            ('zh_quote', {'font': get_font(CHINESE_FONT, font_size, 'bold'), 'lmargin1': 20, 'lmargin2': 20}),
+            ('en_quote', {'font': get_font(ENGLISH_FONT, font_size, 'bold'), 'lmargin1': 20, 'lmargin2': 20}),
+        ]
         
-        # Configure level title tags
+        # Level title tags
         for level in range(1, 7):
             heading_size = StyleManager.get_heading_font_size(level, font_size)
-            text_widget.tag_configure(f'zh_h{level}', 
-                                    font=(CHINESE_FONT, heading_size, 'bold'))
-            text_widget.tag_configure(f'en_h{level}', 
-                                    font=(ENGLISH_FONT, heading_size, 'bold'))
+            tag_options.append((f'zh_h{level}', {'font': get_font(CHINESE_FONT, heading_size, 'bold')}))
+            tag_options.append((f'en_h{level}', {'font': get_font(ENGLISH_FONT, heading_size, 'bold')}))
+        
+        # Configure all tags in one Tcl script instead of one call per tag,
+        # option values are font names, colors and numbers without spaces
+        widget_path = str(text_widget)
+        text_widget.tk.eval('\n'.join(
+            f'{widget_path} tag configure {tag} '
+            + ' '.join(f'-{option} {value}' for option, value in options.items())
+            for tag, options in tag_options
+        ))
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_heading_font_size(level: int, base_size: int) -> int:
         """Calculate font size based on heading level.
         
@@ -128,8 +166,7 @@ class StyleManager:
         Returns:
             Calculated heading font size
         """
-        multipliers = {1: 2.0, 2: 1.5, 3: 1.25, 4: 1.1, 5: 1.0, 6: 0.9}
-        return int(base_size * multipliers.get(level, 1.0))
+        return int(base_size * StyleManager.HEADING_MULTIPLIERS[level - 1])
     
     @staticmethod
     def configure_progress_bar_style() -> str:
@@ -138,11 +175,5 @@ class StyleManager:
         Returns:
             Style name for the progress bar
         """
-        style = ttk.Style()
-        style.configure(
-            "Custom.Horizontal.TProgressbar",
-            troughcolor=COLORS['main_bg'],
-            background=COLORS['primary'],
-            thickness=6
-        )
-        return "Custom.Horizontal.TProgressbar" 
\ No newline at end of file
+        StyleManager.setup_styles()
+        return StyleManager.PROGRESS_BAR_STYLE 
\ No newline at end of file
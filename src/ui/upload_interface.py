@@ -2,12 +2,57 @@
 Upload interface for MyTempo application.
 """
 
+import functools
+import os
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Callable, List, Optional
 
-from src.utils.constants import (COLORS, MAIN_WINDOW_HEIGHT, MAIN_WINDOW_WIDTH,
-                                 PADDING, SUPPORTED_EXTENSIONS)
+from src.utils.constants import (CANVAS_REDRAW_DELAY, COLORS, MAIN_WINDOW_HEIGHT,
+                                 MAIN_WINDOW_WIDTH, PADDING, SUPPORTED_EXTENSIONS)
+from src.utils.window_geometry import center_on_screen
+
+
+# Points per rounded corner, matches Tk's default splinesteps
+_CORNER_STEPS = 12
+
+
+@functools.lru_cache(maxsize=32)
+def _rounded_rectangle_points(x1: int, y1: int, x2: int, y2: int, radius: int) -> tuple:
+    """Get the flat polygon point list for a rounded rectangle.
+    
+    Each corner is sampled from the same quadratic curve Tk's smooth=True
+    draws for a corner point and its two neighbors radius away, so the
+    polygon can be drawn with smooth=False and look the same.
+    
+    Args:
+        x1, y1, x2, y2: Rectangle coordinates
+        radius: Corner radius
+        
+    Returns:
+        Flat tuple of x, y coordinates
+    """
+    half = radius / 2
+    corners = (
+        ((x1, y1 + half), (x1, y1), (x1 + half, y1)),
+        ((x2 - half, y1), (x2, y1), (x2, y1 + half)),
+        ((x2, y2 - half), (x2, y2), (x2 - half, y2)),
+        ((x1 + half, y2), (x1, y2), (x1, y2 - half)),
+    )
+    
+    points = []
+    for (start_x, start_y), (corner_x, corner_y), (end_x, end_y) in corners:
+        for step in range(_CORNER_STEPS + 1):
+            t = step / _CORNER_STEPS
+            a, b, c = (1 - t) ** 2, 2 * (1 - t) * t, t ** 2
+            points.append(a * start_x + b * corner_x + c * end_x)
+            points.append(a * start_y + b * corner_y + c * end_y)
+    return tuple(points)
+
+# Browse button size, its outline is fixed so the points are computed once
+_BUTTON_WIDTH = 140
+_BUTTON_HEIGHT = 44
+_BUTTON_POLY_POINTS = _rounded_rectangle_points(2, 2, _BUTTON_WIDTH - 2, _BUTTON_HEIGHT - 2, 10)
 
 
 class UploadInterface:
@@ -24,15 +69,13 @@ class UploadInterface:
         self.on_file_selected = on_file_selected
         self.card_width = 340  # Card width
         self.card_height = 340  # Card height
+        self.drop_bg: Optional[int] = None  # Drop area background polygon
+        self._draw_after_id: Optional[str] = None
+        self._last_drop_size = (0, 0)
+        self._card_origin = (0, 0)  # Top-left corner of the card content
         # Use screen center to locate geometry
-        window_width = MAIN_WINDOW_WIDTH
-        window_height = MAIN_WINDOW_HEIGHT
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
-        self.root.minsize(window_width, window_height)
+        center_on_screen(self.root, MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT)
+        self.root.minsize(MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT)
         self.root.title("My Tempo")
         self.root.configure(bg=COLORS['main_bg'])
         
@@ -47,9 +90,6 @@ class UploadInterface:
         # Create interface
         self.create_upload_interface()
         
-        # Ensure all widgets are created before centering window
-        self.root.update_idletasks()
-        
     def create_rounded_rectangle(self, canvas: tk.Canvas, x1: int, y1: int, x2: int, y2: int, 
                                radius: int = 12, **kwargs) -> int:
         """Create rounded rectangle on canvas.
@@ -63,46 +103,68 @@ class UploadInterface:
         Returns:
             Canvas item ID
         """
-        points = []
-        for x, y in [(x1, y1 + radius), (x1, y1), (x1 + radius, y1),
-                     (x2 - radius, y1), (x2, y1), (x2, y1 + radius),
-                     (x2, y2 - radius), (x2, y2), (x2 - radius, y2),
-                     (x1 + radius, y2), (x1, y2), (x1, y2 - radius)]:
-            points.extend([x, y])
-        return canvas.create_polygon(points, smooth=True, **kwargs)
+        points = _rounded_rectangle_points(x1, y1, x2, y2, radius)
+        return canvas.create_polygon(*points, **kwargs)
         
     def draw_rounded_rect(self, event: Optional[tk.Event] = None) -> None:
+        """Schedule a redraw of the rounded rectangle background.
+        
+        Configure events arrive in bursts while the window is resized,
+        so the redraw is deferred and only the last size is drawn.
+        """
+        width = self.drop_canvas.winfo_width()
+        height = self.drop_canvas.winfo_height()
+        if (width, height) == self._last_drop_size:
+            return
+        
+        if self._draw_after_id is not None:
+            self.drop_canvas.after_cancel(self._draw_after_id)
+        self._draw_after_id = self.drop_canvas.after(CANVAS_REDRAW_DELAY, self._do_draw_rounded_rect)
+        
+    def _do_draw_rounded_rect(self) -> None:
         """Draw rounded rectangle background."""
-        self.drop_canvas.delete("bg_rect")
+        self._draw_after_id = None
         width = self.drop_canvas.winfo_width()
         height = self.drop_canvas.winfo_height()
         
         if width > 1 and height > 1:
-            self.create_rounded_rectangle(
-                self.drop_canvas,
-                8, 8, width-8, height-8, 
-                radius=12, 
-                fill=COLORS['white'], 
-                outline=COLORS['border'], 
-                width=1,
-                tags="bg_rect"
-            )
+            self._last_drop_size = (width, height)
+            
+            # Create the background once, later redraws only move its points
+            if self.drop_bg is None:
+                self.drop_bg = self.create_rounded_rectangle(
+                    self.drop_canvas,
+                    8, 8, width-8, height-8, 
+                    radius=12, 
+                    fill=COLORS['white'], 
+                    outline=COLORS['border'], 
+                    width=1,
+                    tags="bg_rect"
+                )
+                
+                # Keep the background below the card content drawn earlier
+                self.drop_canvas.tag_lower(self.drop_bg)
+            else:
+                self.drop_canvas.coords(
+                    self.drop_bg,
+                    *_rounded_rectangle_points(8, 8, width-8, height-8, 12)
+                )
             
             # Center card
             x = (width - self.card_width) // 2
             y = (height - self.card_height) // 2
-            self.drop_canvas.coords(self.canvas_frame, x, y)
-            self.drop_frame.configure(width=self.card_width, height=self.card_height)
+            self.drop_canvas.move("card", x - self._card_origin[0], y - self._card_origin[1])
+            self._card_origin = (x, y)
             
     def create_upload_interface(self) -> None:
         """Create file upload interface."""
+        # Import StyleManager here to avoid circular import
+        from src.ui.styles import StyleManager
+        
         main_frame = tk.Frame(self.root, bg=COLORS['main_bg'])
         main_frame.pack(expand=True, fill='both', padx=PADDING['main'], pady=PADDING['main'])
         
-        drop_container = tk.Frame(main_frame, bg=COLORS['main_bg'])
-        drop_container.pack(expand=True, fill='both')
-        
-        self.drop_canvas = tk.Canvas(drop_container, 
+        self.drop_canvas = tk.Canvas(main_frame, 
                                    bg=COLORS['main_bg'], 
                                    highlightthickness=0,
                                    relief='flat')
@@ -110,95 +172,68 @@ class UploadInterface:
         
         self.drop_canvas.bind('<Configure>', self.draw_rounded_rect)
         
-        self.drop_frame = tk.Frame(self.drop_canvas, bg=COLORS['white'], width=self.card_width, height=self.card_height)
-        self.canvas_frame = self.drop_canvas.create_window(0, 0, anchor='nw', window=self.drop_frame, width=self.card_width, height=self.card_height)
-        
-        # Let drop_frame adapt to canvas
-        self.drop_frame.pack_propagate(False)
-        
-        # Fill content area with pack
-        drop_content_frame = tk.Frame(self.drop_frame, bg=COLORS['white'])
-        drop_content_frame.pack(expand=True, fill='both')
-        
-        # File icon
-        tk.Label(drop_content_frame,
-                text="📄",
-                font=('Inter', 48),
-                bg=COLORS['white'],
-                fg=COLORS['primary']).pack(pady=(0, 16))
-        
-        # Main text
-        tk.Label(drop_content_frame,
-                text="Select Markdown files",
-                font=('Inter', 16, 'bold'),
-                fg=COLORS['text_primary'],
-                bg=COLORS['white']).pack(pady=(0, 8))
-        
-        # Sub text
-        tk.Label(drop_content_frame,
-                text="Click the button below to browse",
-                font=('Inter', 12),
-                fg=COLORS['text_secondary'],
-                bg=COLORS['white']).pack(pady=(0, 24))
-        
-        # Button frame
-        button_frame = tk.Frame(drop_content_frame, bg=COLORS['white'])
-        button_frame.pack(pady=6)
-        
-        self.button_canvas = tk.Canvas(button_frame, 
-                                     width=140, height=44,
-                                     bg=COLORS['white'], 
-                                     highlightthickness=0)
-        self.button_canvas.pack()
-        
-        self.button_bg = self.create_rounded_rectangle(
-            self.button_canvas,
-            2, 2, 138, 42,
-            radius=10,
+        # Card content is drawn directly on the drop canvas, laid out relative
+        # to the card's top-left corner and moved as a whole with the "card" tag
+        center_x = self.card_width // 2
+        text_items = []
+        for text, font, color, pady in (
+            ("📄", StyleManager.get_font(size=48), COLORS['primary'], 16),
+            ("Select Markdown files", StyleManager.get_font(size=16, weight='bold'), COLORS['text_primary'], 8),
+            ("Click the button below to browse", StyleManager.get_font(size=12), COLORS['text_secondary'], 24),
+        ):
+            item = self.drop_canvas.create_text(
+                center_x, 0,
+                text=text,
+                font=font,
+                fill=color,
+                anchor='n',
+                tags="card"
+            )
+            _, top, _, bottom = self.drop_canvas.bbox(item)
+            text_items.append((item, bottom - top, pady))
+        
+        # Center the text and button vertically in the card
+        button_pady = 6
+        content_height = sum(height + pady for _, height, pady in text_items) + _BUTTON_HEIGHT + 2 * button_pady
+        y = (self.card_height - content_height) // 2
+        for item, height, pady in text_items:
+            self.drop_canvas.coords(item, center_x, y)
+            y += height + pady
+        y += button_pady
+        
+        # Create the button from its precomputed outline, then move it into place
+        self.button_bg = self.drop_canvas.create_polygon(
+            *_BUTTON_POLY_POINTS,
             fill=COLORS['primary'],
             outline='',
-            tags="button_bg"
+            tags=("card", "button")
         )
+        self.drop_canvas.move(self.button_bg, center_x - _BUTTON_WIDTH // 2, y)
         
-        self.button_text = self.button_canvas.create_text(
-            70, 22,
+        # Disabled so the pointer stays on the button background underneath
+        self.button_text = self.drop_canvas.create_text(
+            center_x, y + _BUTTON_HEIGHT // 2,
             text="Browse Files",
-            font=('Inter', 15, 'bold'),
+            font=StyleManager.get_font(size=15, weight='bold'),
             fill=COLORS['white'],
-            tags="button_text"
+            state='disabled',
+            tags="card"
         )
         
         # Button events
-        self.button_canvas.bind('<Button-1>', lambda e: self.select_file())
-        self.button_canvas.bind('<Enter>', self.on_button_enter)
-        self.button_canvas.bind('<Leave>', self.on_button_leave)
-        self.button_canvas.configure(cursor='hand2')
+        self.drop_canvas.tag_bind("button", '<Button-1>', lambda e: self.select_file())
+        self.drop_canvas.tag_bind("button", '<Enter>', self.on_button_enter)
+        self.drop_canvas.tag_bind("button", '<Leave>', self.on_button_leave)
         
     def on_button_enter(self, event: Optional[tk.Event] = None) -> None:
         """Handle mouse enter button."""
-        self.button_canvas.delete("button_bg")
-        self.button_bg = self.create_rounded_rectangle(
-            self.button_canvas,
-            2, 2, 138, 42,
-            radius=10,
-            fill=COLORS['primary_hover'],
-            outline='',
-            tags="button_bg"
-        )
-        self.button_canvas.tag_raise("button_text")
+        self.drop_canvas.itemconfigure(self.button_bg, fill=COLORS['primary_hover'])
+        self.drop_canvas.configure(cursor='hand2')
         
     def on_button_leave(self, event: Optional[tk.Event] = None) -> None:
         """Handle mouse leave button."""
-        self.button_canvas.delete("button_bg")
-        self.button_bg = self.create_rounded_rectangle(
-            self.button_canvas,
-            2, 2, 138, 42,
-            radius=10,
-            fill=COLORS['primary'],
-            outline='',
-            tags="button_bg"
-        )
-        self.button_canvas.tag_raise("button_text")
+        self.drop_canvas.itemconfigure(self.button_bg, fill=COLORS['primary'])
+        self.drop_canvas.configure(cursor='')
         
     def select_file(self) -> None:
         """Open file dialog to select files."""
@@ -220,14 +255,19 @@ class UploadInterface:
         """
         # Filter for supported extensions
         valid_files = []
+        invalid_names = []
         for file_path in file_paths:
-            if any(file_path.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS):
+            if os.path.splitext(file_path)[1].lower() in SUPPORTED_EXTENSIONS:
                 valid_files.append(file_path)
             else:
-                messagebox.showwarning(
-                    "Unsupported file type",
-                    f"File {file_path} is not a supported Markdown file."
-                )
+                invalid_names.append(os.path.basename(file_path))
+        
+        # Report all unsupported files in a single dialog
+        if invalid_names:
+            messagebox.showwarning(
+                "Unsupported file type",
+                "The following files are not supported Markdown files:\n\n" + "\n".join(invalid_names)
+            )
         
         if valid_files:
             self.on_file_selected(valid_files) 
\ No newline at end of file
@@ -9,6 +9,9 @@ VERSION = "0.5.3"
 FONT_SIZES = [20, 22, 24, 28, 32, 36, 48, 60, 72]
 DEFAULT_FONT_SIZE = 24
 
+# Font files registered by the font loader
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
 # Font families
 CHINESE_FONT = "Noto Sans SC"
 ENGLISH_FONT = "Inter"
@@ -18,6 +21,10 @@ BASE_SPEED = 0.0002
 SCROLL_SPEEDS = [1, 2, 3, 4, 5]
 DEFAULT_SPEED_INDEX = 0
 SCROLL_INTERVAL = 16  # milliseconds
+MAX_SCROLL_CATCH_UP = 3.0  # scroll intervals made up in one step after a stall
+
+# Minimum time between speed or opacity steps while a key is held
+KEY_REPEAT_INTERVAL = 0.05  # seconds
 
 # Opacity configuration
 OPACITY_LEVELS = [1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1]
@@ -28,6 +35,8 @@ DEFAULT_WINDOW_WIDTH = 800
 DEFAULT_WINDOW_HEIGHT = 700
 MAIN_WINDOW_WIDTH = 600
 MAIN_WINDOW_HEIGHT = 450
+RESIZE_DEBOUNCE_DELAY = 150  # milliseconds
+CANVAS_REDRAW_DELAY = 16  # milliseconds
 
 # Colors
 COLORS = {
@@ -55,8 +64,14 @@ PADDING = {
 
 # File configuration
 CONFIG_FILE = "user_settings.json"
-SUPPORTED_EXTENSIONS = ('.md', '.markdown')
+CONFIG_SAVE_DELAY = 500  # milliseconds
+SUPPORTED_EXTENSIONS = frozenset({'.md', '.markdown'})
+FALLBACK_ENCODING = 'gbk'  # Used when a file isn't UTF-8 and chardet can't tell
+ENCODING_SAMPLE_SIZE = 65536  # bytes
 
 # Loading configuration
 MIN_LOADING_TIME = 1.0  # seconds
-LOADING_COMPLETE_DELAY = 0.2  # seconds 
\ No newline at end of file
+FONT_LOADING_POLL_INTERVAL = 16  # milliseconds
+PROGRESS_REDRAW_INTERVAL = 16  # milliseconds
+DOCUMENT_POLL_INTERVAL = 30  # milliseconds
+RENDER_BATCH_SIZE = 2000  # text runs inserted per event loop turn 
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Text decoding utility for MyTempo application.
+"""
+
+import codecs
+import re
+
+from src.utils.constants import ENCODING_SAMPLE_SIZE, FALLBACK_ENCODING
+
+# Byte order marks and the codecs that consume them while decoding.
+# UTF-32 comes first, its little-endian mark starts with the UTF-16 one.
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# First byte outside ASCII, where text in a legacy encoding starts
+NON_ASCII_PATTERN = re.compile(rb'[\x80-\xff]')
+
+
+def decode_text(data: bytes) -> str:
+    """Decode file content, detecting the encoding when it isn't UTF-8.
+    
+    A byte order mark selects the codec directly. Otherwise the content is
+    decoded once as UTF-8, which also covers ASCII, and only if that fails
+    is the encoding guessed. The guess only sees a sample, so it
+    and FALLBACK_ENCODING are tried strictly before bytes are replaced.
+    
+    Args:
+        data: Raw file content
+        
+    Returns:
+        Decoded text without byte order mark, undecodable bytes are replaced
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if data.startswith(bom):
+            return data.decode(encoding, errors='replace')
+    
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    encoding = guess_encoding(data)
+    for candidate in dict.fromkeys((encoding, FALLBACK_ENCODING)):
+        try:
+            return data.decode(candidate)
+        except UnicodeDecodeError:
+            pass
+    
+    return data.decode(encoding, errors='replace')
+
+
+def guess_encoding(data: bytes) -> str:
+    """Guess the encoding of content that isn't UTF-8.
+    
+    Only a sample is passed to chardet, when it is installed. It starts at
+    the first non-ASCII byte, an ASCII-only sample would say nothing about
+    the text that follows.
+    
+    Args:
+        data: Raw file content
+        
+    Returns:
+        Codec name, FALLBACK_ENCODING when no better guess is available
+    """
+    try:
+        import chardet
+        match = NON_ASCII_PATTERN.search(data)
+        start = match.start() if match else 0
+        encoding = chardet.detect(data[start:start + ENCODING_SAMPLE_SIZE])['encoding']
+        if encoding:
+            codecs.lookup(encoding)
+            return encoding
+    except ImportError:
+        # chardet not available, use the fallback encoding
+        pass
+    except LookupError:
+        # Unknown encoding name reported by chardet
+        pass
+    return FALLBACK_ENCODING
@@ -1,6 +1,10 @@
 import os
-from ctypes import windll
-from typing import Callable, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ctypes import c_int, c_uint, c_void_p, c_wchar_p, windll
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.utils.constants import FONT_EXTENSIONS
 
 
 def get_fonts_dir():
@@ -27,9 +31,31 @@ def get_fonts_dir():
     return None
 
 FONTS_DIR = get_fonts_dir()
+MAX_FONT_WORKERS = 8
+FR_PRIVATE = 0x10  # Font is only visible to this process
+
+# Resolve the GDI entry points once and declare their signatures
+_AddFontResourceExW = windll.gdi32.AddFontResourceExW
+_AddFontResourceExW.argtypes = [c_wchar_p, c_uint, c_void_p]
+_AddFontResourceExW.restype = c_int
+
+# Paths of fonts registered by load_fonts, used to skip them on later calls
+_registered_fonts: Set[str] = set()
+
+# Font files left for ensure_font_loaded, keyed by font folder name.
+# The lock is held while a family registers, so a caller that needs the
+# family waits for a background registration already in progress.
+_lazy_fonts: Dict[str, List[str]] = {}
+_lazy_fonts_lock = threading.Lock()
+
+# Set once load_fonts has finished, so fonts can be loaded on a worker thread
+fonts_loaded = threading.Event()
 
 def add_font_resource(font_path: str) -> int:
-    """Register font file in Windows
+    """Register font file in Windows for this process only
+    
+    Private fonts skip the system-wide font table update and are
+    released automatically when the process exits.
     
     Args:
         font_path: Full path to the font file
@@ -37,44 +63,123 @@ def add_font_resource(font_path: str) -> int:
     Returns:
         int: Non-zero on success, 0 on failure
     """
-    return windll.gdi32.AddFontResourceW(font_path)
+    return _AddFontResourceExW(font_path, FR_PRIVATE, None)
 
-def load_fonts(progress_callback: Optional[Callable[[int, int, str], None]] = None) -> bool:
+def load_fonts(progress_callback: Optional[Callable[[int, int, str], None]] = None,
+               eager: Optional[Set[str]] = None) -> bool:
     """Load font files from the fonts folder
     
+    Fonts already registered in this process are skipped, so repeated
+    calls only pay for the directory scan. fonts_loaded is set when the
+    call returns, whether or not any font could be registered.
+    
     Args:
         progress_callback: Progress callback function with parameters (current, total, font_name)
+        eager: Font families to register now, other families are left for
+            ensure_font_loaded. All fonts are registered when None.
     
     Returns:
         bool: Whether at least one font was loaded successfully
     """
+    try:
+        return _register_font_files(progress_callback, eager)
+    finally:
+        fonts_loaded.set()
+
+def ensure_font_loaded(family: str) -> bool:
+    """Register a font family that load_fonts left for later
+    
+    Calling it again for the same family does nothing.
+    
+    Args:
+        family: Font family name, e.g. "Noto Sans SC"
+        
+    Returns:
+        bool: Whether this call registered at least one font file
+    """
+    loaded = False
+    with _lazy_fonts_lock:
+        for font_path in _lazy_fonts.pop(_font_folder_key(family), []):
+            try:
+                if add_font_resource(font_path):
+                    _registered_fonts.add(font_path)
+                    loaded = True
+            except Exception:
+                pass  # Silently ignore font loading errors
+    return loaded
+
+def load_deferred_fonts() -> None:
+    """Register every family load_fonts left for later
+    
+    Meant to run on a background thread once the main window is shown,
+    so opening a document finds its fonts already registered.
+    """
+    with _lazy_fonts_lock:
+        families = list(_lazy_fonts)
+    for family in families:
+        ensure_font_loaded(family)
+
+def _font_folder_key(name: str) -> str:
+    """Match a font family to its folder, "Noto Sans SC" lives in NotoSansSC"""
+    return name.replace(' ', '').lower()
+
+def _register_font_files(progress_callback: Optional[Callable[[int, int, str], None]],
+                         eager: Optional[Set[str]]) -> bool:
+    """Collect and register font files, see load_fonts"""
     if not FONTS_DIR:
         return False
     
+    eager_keys = None if eager is None else {_font_folder_key(family) for family in eager}
     font_files: List[Tuple[str, str]] = []
     
-    # Collect all font files
-    for root, _, files in os.walk(FONTS_DIR):
-        font_files.extend(
-            (os.path.join(root, file), file)
-            for file in files if file.lower().endswith('.ttf')
-        )
+    # Collect all font files, DirEntry caches the file type so no extra stat is needed.
+    # Each directory is paired with its family folder, fonts directly in FONTS_DIR have none.
+    pending_dirs: List[Tuple[str, Optional[str]]] = [(FONTS_DIR, None)]
+    while pending_dirs:
+        dir_path, folder_key = pending_dirs.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue  # Skip directories that vanished or cannot be read
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append((entry.path, folder_key or _font_folder_key(entry.name)))
+                elif (entry.name.lower().endswith(FONT_EXTENSIONS)
+                      and entry.path not in _registered_fonts):
+                    if eager_keys is None or folder_key is None or folder_key in eager_keys:
+                        font_files.append((entry.path, entry.name))
+                    else:
+                        with _lazy_fonts_lock:
+                            deferred = _lazy_fonts.setdefault(folder_key, [])
+                            if entry.path not in deferred:
+                                deferred.append(entry.path)
     
+    # Fonts registered by an earlier call are still available
     if not font_files:
-        return False
+        return bool(_registered_fonts)
     
-    # Register fonts
+    # Register fonts in parallel, AddFontResourceExW releases the GIL while it blocks
     total_fonts = len(font_files)
     loaded_count = 0
     
-    for index, (font_path, filename) in enumerate(font_files, 1):
-        try:
-            if add_font_resource(font_path):
-                loaded_count += 1
-                
-                if progress_callback:
-                    progress_callback(index, total_fonts, filename)
-        except Exception:
-            pass  # Silently ignore font loading errors
+    with ThreadPoolExecutor(max_workers=min(MAX_FONT_WORKERS, total_fonts)) as executor:
+        futures = {
+            executor.submit(add_font_resource, font_path): (font_path, filename)
+            for font_path, filename in font_files
+        }
+        
+        # Results are collected on the calling thread, so the callback needs no locking
+        for index, future in enumerate(as_completed(futures), 1):
+            try:
+                font_path, filename = futures[future]
+                if future.result():
+                    loaded_count += 1
+                    _registered_fonts.add(font_path)
+                    
+                    if progress_callback:
+                        progress_callback(index, total_fonts, filename)
+            except Exception:
+                pass  # Silently ignore font loading errors
     
     return loaded_count > 0 
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+Window geometry utility for MyTempo application.
+"""
+
+import tkinter as tk
+from typing import Optional, Tuple
+
+# Screen size, queried from Tk once per process
+_screen_size: Optional[Tuple[int, int]] = None
+
+
+def get_screen_size(window: tk.Misc) -> Tuple[int, int]:
+    """Get screen dimensions.
+    
+    Args:
+        window: Any widget, used for the first query only
+        
+    Returns:
+        Screen width and height in pixels
+    """
+    global _screen_size
+    if _screen_size is None:
+        _screen_size = (window.winfo_screenwidth(), window.winfo_screenheight())
+    return _screen_size
+
+
+def center_on_screen(window: tk.Misc, width: int, height: int) -> None:
+    """Set window size and center it on the screen.
+    
+    Args:
+        window: Window to position
+        width: Window width
+        height: Window height
+    """
+    screen_width, screen_height = get_screen_size(window)
+    
+    # Calculate window position to center it
+    x = (screen_width - width) // 2
+    y = (screen_height - height) // 2
+    
+    window.geometry(f"{width}x{height}+{x}+{y}")